@@ -1,6 +1,13 @@
 """Fear and Greed Index scraper package."""
 
-from .fngindex import FearAndGreedIndex
-
 __version__ = "0.1.0"
 __all__ = ["FearAndGreedIndex"]
+
+
+def __getattr__(name: str):
+    # Import lazily so the CLI does not load polars/requests for every command
+    if name == "FearAndGreedIndex":
+        from .fngindex import FearAndGreedIndex
+
+        return FearAndGreedIndex
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,8 +7,6 @@ from typing import Optional
 import typer
 from rich.console import Console
 
-from .fngindex import FearAndGreedIndex
-
 app = typer.Typer(
     name="fng-cli",
     help="Fear and Greed Index scraper with CLI interface",
@@ -33,14 +31,15 @@ def scrape(
         help="End date for data collection (YYYY-MM-DD format). Defaults to today.",
         show_default="today",
     ),
-    input_csv: Optional[Path] = typer.Option(
+    input_file: Optional[Path] = typer.Option(
         None,
+        "--input",
         "--input-csv",
         "-i",
-        help="Path to existing CSV file to merge with new data",
+        help="Path to existing Parquet/CSV file or partitioned dataset to merge",
         exists=False,  # Allow non-existing files
         file_okay=True,
-        dir_okay=False,
+        dir_okay=True,
     ),
     output_file: Path = typer.Option(
         "fng_data.parquet", "--output", "-o", help="Output file path"
@@ -52,12 +51,38 @@ def scrape(
         help="Output format (parquet or csv)",
         case_sensitive=False,
     ),
+    parquet_engine: str = typer.Option(
+        "pyarrow",
+        "--parquet-engine",
+        help="Parquet writer engine (polars or pyarrow)",
+        case_sensitive=False,
+    ),
+    compression: str = typer.Option(
+        "zstd",
+        "--compression",
+        help="Parquet compression (zstd, snappy, lz4, gzip, brotli or uncompressed)",
+        case_sensitive=False,
+    ),
+    row_group_size: int = typer.Option(
+        8192,
+        "--row-group-size",
+        help="Number of rows per Parquet row group",
+        min=1,
+    ),
+    partitioned: bool = typer.Option(
+        False,
+        "--partitioned",
+        help="Write a Parquet dataset directory partitioned by year (needs pyarrow)",
+    ),
     backfill: bool = typer.Option(
         False, "--backfill", "-b", help="Backfill missing values instead of using zeros"
     ),
     show_summary: bool = typer.Option(
         True, "--summary/--no-summary", help="Display data summary after processing"
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the on-disk cache of CNN API responses"
+    ),
 ) -> None:
     """
     Scrape Fear and Greed Index data from CNN API.
@@ -69,6 +94,11 @@ def scrape(
         console.print("[red]Error: Format must be 'parquet' or 'csv'[/red]")
         raise typer.Exit(1)
 
+    # Validate parquet engine
+    if parquet_engine.lower() not in ["polars", "pyarrow"]:
+        console.print("[red]Error: Parquet engine must be 'polars' or 'pyarrow'[/red]")
+        raise typer.Exit(1)
+
     # Validate dates
     try:
         start_dt = datetime.strptime(start_date, "%Y-%m-%d")
@@ -82,36 +112,59 @@ def scrape(
         console.print(f"[red]Error: Invalid date format. Use YYYY-MM-DD. {e}[/red]")
         raise typer.Exit(1)
 
-    # Ensure output file has correct extension
-    if format_type.lower() == "parquet" and not output_file.suffix == ".parquet":
+    if partitioned and format_type.lower() != "parquet":
+        console.print("[red]Error: --partitioned requires parquet format[/red]")
+        raise typer.Exit(1)
+
+    # Ensure output file has correct extension, datasets are plain directories
+    if partitioned:
+        if output_file.suffix == ".parquet":
+            output_file = output_file.with_suffix("")
+    elif format_type.lower() == "parquet" and not output_file.suffix == ".parquet":
         output_file = output_file.with_suffix(".parquet")
     elif format_type.lower() == "csv" and not output_file.suffix == ".csv":
         output_file = output_file.with_suffix(".csv")
 
     try:
+        # Deferred so that other commands do not pay for importing polars/requests
+        from .fngindex import FearAndGreedIndex
+
+        # Validate compression before any data is fetched
+        if compression.lower() not in FearAndGreedIndex.PARQUET_COMPRESSIONS:
+            codecs = ", ".join(FearAndGreedIndex.PARQUET_COMPRESSIONS)
+            raise ValueError(f"Compression must be one of: {codecs}")
+
         console.print(f"[bold blue]Fear and Greed Index Scraper[/bold blue]")
         console.print(f"Date range: {start_date} to {end_date}")
 
-        if input_csv:
-            console.print(f"Input CSV: {input_csv}")
+        if input_file:
+            console.print(f"Input: {input_file}")
 
         console.print(f"Output: {output_file} ({format_type.upper()})")
         console.print(f"Backfill: {'Enabled' if backfill else 'Disabled'}")
         console.print()
 
         # Initialize scraper
-        scraper = FearAndGreedIndex(console=console)
+        scraper = FearAndGreedIndex(console=console, use_cache=not no_cache)
 
         # Process data
         data = scraper.process_data(
-            start_date=start_date,
-            end_date=end_date,
-            csv_file=input_csv,
+            start_date=start_dt.date(),
+            end_date=end_dt.date(),
+            input_file=input_file,
             backfill=backfill,
         )
 
         # Save data
-        scraper.save_data(data, output_file, format_type)
+        scraper.save_data(
+            data,
+            output_file,
+            format_type,
+            parquet_engine,
+            compression=compression,
+            row_group_size=row_group_size,
+            partitioned=partitioned,
+        )
 
         # Show summary if requested
         if show_summary:
@@ -127,6 +180,60 @@ def scrape(
         raise typer.Exit(1)
 
 
+@app.command("convert-csv")
+def convert_csv(
+    input_csv: Path = typer.Argument(
+        ...,
+        help="Path to existing CSV file to convert",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    output_file: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Output Parquet file path. Defaults to the input path with .parquet",
+        show_default="input with .parquet",
+    ),
+    parquet_engine: str = typer.Option(
+        "pyarrow",
+        "--parquet-engine",
+        help="Parquet writer engine (polars or pyarrow)",
+        case_sensitive=False,
+    ),
+) -> None:
+    """
+    Convert an existing Fear and Greed CSV file to Parquet.
+
+    The resulting file can be passed to [bold]scrape --input[/bold] for faster merges.
+    """
+    # Validate input format
+    if input_csv.suffix.lower() != ".csv":
+        console.print("[red]Error: Input file must be a .csv file[/red]")
+        raise typer.Exit(1)
+
+    if output_file is None:
+        output_file = input_csv.with_suffix(".parquet")
+    elif output_file.suffix != ".parquet":
+        output_file = output_file.with_suffix(".parquet")
+
+    try:
+        from .fngindex import FearAndGreedIndex
+
+        scraper = FearAndGreedIndex(console=console)
+        data = scraper.load_existing_data(input_csv)
+        scraper.save_data(data, output_file, "parquet", parquet_engine)
+
+        console.print(
+            f"\n[bold green]✓ Converted {data.height} records to Parquet![/bold green]"
+        )
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
 @app.command()
 def info() -> None:
     """Display information about the Fear and Greed Index."""
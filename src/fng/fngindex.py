@@ -1,35 +1,185 @@
 """Fear and Greed Index scraper with CLI interface."""
 
-from datetime import datetime
+import json
+from datetime import date, timedelta
+from functools import cache, cached_property
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Optional
 
 import polars as pl
 import requests
-from fake_useragent import UserAgent
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+
+try:
+    import orjson
+except ImportError:  # Optional dependency: fall back to the stdlib JSON parser
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:  # Optional dependency: fall back to uncached requests
+    requests_cache = None
+
+try:
+    from platformdirs import user_cache_dir
+except ImportError:
+    user_cache_dir = None
 
 console = Console()
 
 
+def get_cache_dir() -> Path:
+    """Return the per-user cache directory for fng, creating it if needed."""
+    if user_cache_dir is not None:
+        cache_dir = Path(user_cache_dir("fng"))
+    else:
+        cache_dir = Path.home() / ".cache" / "fng"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+@cache
+def _random_user_agent() -> str:
+    """Sample a user agent once per process, loading fake-useragent lazily."""
+    from fake_useragent import UserAgent
+
+    return UserAgent().random
+
+
+def _loads_json(content: bytes):
+    """Parse a JSON document, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _dumps_json(obj) -> bytes:
+    """Serialize an object to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
 class FearAndGreedIndex:
     """Fear and Greed Index data scraper and processor."""
 
     BASE_URL = "https://production.dataviz.cnn.io/index/fearandgreed/graphdata/"
+    CACHE_EXPIRE_AFTER = timedelta(hours=6)
+    REQUEST_TIMEOUT = (3.05, 30)
+    PARQUET_COMPRESSIONS = ("zstd", "snappy", "lz4", "gzip", "brotli", "uncompressed")
+    ZSTD_COMPRESSION_LEVEL = 3
 
-    def __init__(self, console: Optional[Console] = None):
+    def __init__(self, console: Optional[Console] = None, use_cache: bool = True):
         """Initialize the scraper with console for output."""
         self.console = console or Console()
-        self.ua = UserAgent()
+        self.use_cache = use_cache
+
+    @cached_property
+    def session(self) -> requests.Session:
+        """Keep-alive HTTP session, created on first use."""
+        return self._create_session(self.use_cache)
+
+    def _create_session(self, use_cache: bool) -> requests.Session:
+        """Create a keep-alive HTTP session with retries.
+
+        The session is cached on disk when requests-cache is available.
+        """
+        if requests_cache is None:
+            session = requests.Session()
+        else:
+            session = requests_cache.CachedSession(
+                str(get_cache_dir() / "http_cache"),
+                backend="sqlite",
+                expire_after=self.CACHE_EXPIRE_AFTER if use_cache else 0,
+            )
+
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # Only advertise encodings urllib3 can decode (br requires brotli)
+        session.headers.update({"Accept-Encoding": ACCEPT_ENCODING})
+        return session
 
     def get_headers(self) -> dict[str, str]:
-        """Generate request headers with random user agent."""
-        return {"User-Agent": self.ua.random}
+        """Return request headers with a user agent sampled once per process."""
+        return {"User-Agent": _random_user_agent()}
+
+    def _validator_cache_path(self) -> Optional[Path]:
+        """Return the metadata sidecar path used for conditional GETs, if enabled.
+
+        requests-cache revalidates expired responses on its own, so the sidecar
+        is only used when caching is enabled and requests-cache is unavailable.
+        The small metadata file holds the validators; the raw response body is
+        kept next to it so it is only read back on a 304. Both are overwritten
+        by each successful response.
+        """
+        if not self.use_cache or requests_cache is not None:
+            return None
+        return get_cache_dir() / "graphdata.meta.json"
+
+    def _load_validator_cache(
+        self, path: Optional[Path], start_date: date
+    ) -> Optional[dict]:
+        """Load the cached validators for the same start date."""
+        if path is None or not path.exists():
+            return None
+        try:
+            cached = _loads_json(path.read_bytes())
+        except ValueError:
+            return None
+        if cached.get("start_date") != start_date.isoformat():
+            return None
+        if not path.with_name(cached.get("payload_file", "")).is_file():
+            return None
+        return cached
+
+    def _save_validator_cache(
+        self, path: Optional[Path], start_date: date, response: requests.Response
+    ):
+        """Persist response validators and body for the next conditional GET."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if path is None or not (etag or last_modified):
+            return
+        payload_file = "graphdata.json"
+        path.with_name(payload_file).write_bytes(response.content)
+        path.write_bytes(
+            _dumps_json(
+                {
+                    "start_date": start_date.isoformat(),
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "payload_file": payload_file,
+                }
+            )
+        )
+
+    def fetch_historical_data(self, start_date: date) -> dict:
+        """Fetch historical Fear and Greed data from CNN API.
+
+        When a previous response is cached, the request is sent with
+        If-None-Match/If-Modified-Since and a 304 reuses the cached body.
+        """
+        cache_path = self._validator_cache_path()
+        cached = self._load_validator_cache(cache_path, start_date)
+
+        headers = self.get_headers()
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
 
-    def fetch_historical_data(self, start_date: str) -> dict:
-        """Fetch historical Fear and Greed data from CNN API."""
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -37,90 +187,207 @@ class FearAndGreedIndex:
         ) as progress:
             task = progress.add_task("Fetching data from CNN API...", total=1)
 
-            response = requests.get(
-                f"{self.BASE_URL}{start_date}", headers=self.get_headers()
+            response = self.session.get(
+                f"{self.BASE_URL}{start_date.isoformat()}",
+                headers=headers,
+                timeout=self.REQUEST_TIMEOUT,
             )
             response.raise_for_status()
             progress.advance(task)
 
-        return response.json()
+        if response.status_code == 304 and cached:
+            return _loads_json(
+                cache_path.with_name(cached["payload_file"]).read_bytes()
+            )
 
-    def load_existing_data(self, csv_file: Path) -> Optional[pl.DataFrame]:
-        """Load existing data from CSV file if it exists."""
-        if not csv_file.exists():
-            self.console.print(f"[yellow]Warning: {csv_file} not found[/yellow]")
+        payload = _loads_json(response.content)
+        self._save_validator_cache(cache_path, start_date, response)
+        return payload
+
+    def load_existing_data(self, input_file: Path) -> Optional[pl.DataFrame]:
+        """Load existing data from a Parquet/CSV file or partitioned dataset."""
+        if not input_file.exists():
+            self.console.print(f"[yellow]Warning: {input_file} not found[/yellow]")
             return None
 
-        return pl.read_csv(
-            csv_file, try_parse_dates=True, columns=["Date", "Fear Greed"]
-        ).with_columns(pl.col("Date").cast(pl.Date))
+        if input_file.is_dir():
+            data = (
+                pl.scan_parquet(input_file, hive_partitioning=True)
+                .select("Date", "Fear Greed")
+                .collect()
+            )
+        elif input_file.suffix.lower() == ".parquet":
+            data = pl.read_parquet(input_file, columns=["Date", "Fear Greed"])
+        elif input_file.suffix.lower() == ".csv":
+            data = pl.read_csv(
+                input_file, try_parse_dates=True, columns=["Date", "Fear Greed"]
+            )
+        else:
+            raise ValueError(f"Unsupported input format: {input_file.suffix}")
+
+        return data.with_columns(
+            pl.col("Date").cast(pl.Date), pl.col("Fear Greed").cast(pl.Int64)
+        )
+
+    def _fetch_start_date(
+        self, fng_data: pl.DataFrame, start_date: date, end_date: date
+    ) -> Optional[date]:
+        """Return the first date to fetch from the API, or None if fully covered.
+
+        Coverage only counts real values: zero or null rows are placeholders
+        written for days the API had no data yet. A range ending on a weekend
+        is covered by data through the preceding Friday, as the index is only
+        published on trading days. Values from yesterday or today may still be
+        revised intraday, so they are never treated as final and are refetched.
+        """
+        real_dates = pl.col("Date").filter(
+            pl.col("Fear Greed").is_not_null() & (pl.col("Fear Greed") != 0)
+        )
+        have_min, have_max = fng_data.select(
+            real_dates.min(), real_dates.max().alias("max_date")
+        ).row(0)
+
+        if have_min is None or have_min > start_date:
+            return start_date
+
+        last_trading_day = end_date
+        while last_trading_day.weekday() >= 5:
+            last_trading_day -= timedelta(days=1)
+
+        may_change = have_max >= date.today() - timedelta(days=1)
+        if have_max >= last_trading_day and not may_change:
+            return None
+        if may_change:
+            return max(start_date, have_max)
+        return max(start_date, have_max + timedelta(days=1))
 
     def process_data(
         self,
-        start_date: str,
-        end_date: str,
-        csv_file: Optional[Path] = None,
+        start_date: date,
+        end_date: date,
+        input_file: Optional[Path] = None,
         backfill: bool = False,
     ) -> pl.DataFrame:
         """Process Fear and Greed Index data."""
         # Load existing data if provided
-        if csv_file:
-            fng_data = self.load_existing_data(csv_file)
-        else:
+        fng_data = self.load_existing_data(input_file) if input_file else None
+        if fng_data is None:
             # Create empty DataFrame with correct schema
             fng_data = pl.DataFrame(
                 {"Date": [], "Fear Greed": []},
                 schema={"Date": pl.Date, "Fear Greed": pl.Int64},
             )
 
-        # Fetch new data from API
-        api_data = self.fetch_historical_data(start_date)
-        historical_data = api_data["fear_and_greed_historical"]["data"]
-
-        # Convert API data to DataFrame
-        api_records = []
-        for record in historical_data:
-            timestamp = int(record["x"])
-            date = datetime.fromtimestamp(timestamp / 1000).date()
-            value = int(record["y"])
-            api_records.append({"Date": date, "Fear Greed": value})
-
-        api_df = pl.DataFrame(api_records)
-
-        # Combine existing data with API data
-        if fng_data.height > 0:
-            # Merge dataframes, API data takes precedence
-            combined = fng_data.join(api_df, on="Date", how="outer_coalesce")
+        # Fetch from the API only the dates not covered by existing data
+        fetch_start = self._fetch_start_date(fng_data, start_date, end_date)
+        if fetch_start is None:
+            self.console.print(
+                "[green]✓ Existing data covers the requested range, "
+                "skipping API request[/green]"
+            )
+            historical_data = []
         else:
-            combined = api_df
+            api_data = self.fetch_historical_data(fetch_start)
+            historical_data = api_data["fear_and_greed_historical"]["data"]
+
+        # Convert API data to a LazyFrame, converting timestamps in a single pass
+        api_lf = (
+            pl.DataFrame(
+                {
+                    "ts_ms": [record["x"] for record in historical_data],
+                    "Fear Greed": [record["y"] for record in historical_data],
+                },
+                schema={"ts_ms": pl.Float64, "Fear Greed": pl.Float64},
+            )
+            .lazy()
+            .select(
+                pl.from_epoch(pl.col("ts_ms").cast(pl.Int64), time_unit="ms")
+                .dt.date()
+                .alias("Date"),
+                pl.col("Fear Greed").cast(pl.Int64),
+            )
+        )
 
-        # Create date range and fill missing dates
-        date_range = pl.DataFrame().select(
-            pl.date_range(
-                start=datetime.strptime(start_date, "%Y-%m-%d").date(),
-                end=datetime.strptime(end_date, "%Y-%m-%d").date(),
-                interval="1d",
-            ).alias("Date")
+        # Combine existing data with API data, API rows come last so they win
+        combined = pl.concat([fng_data.lazy(), api_lf]).unique(
+            subset="Date", keep="last"
         )
 
-        # Join with date range to ensure all dates are present
-        result = date_range.join(combined, on="Date", how="left")
+        # Create date range and fill missing dates
+        date_range = (
+            pl.date_range(start=start_date, end=end_date, interval="1d", eager=True)
+            .alias("Date")
+            .to_frame()
+            .lazy()
+        )
 
         # Fill missing values
         if backfill:
-            result = result.with_columns(
-                pl.col("Fear Greed").fill_null(strategy="backward")
-            )
+            fill = pl.col("Fear Greed").fill_null(strategy="backward")
         else:
-            result = result.with_columns(pl.col("Fear Greed").fill_null(0))
+            fill = pl.col("Fear Greed").fill_null(0)
+
+        # Join with date range to ensure all dates are present, sort before
+        # filling so backward fill follows date order, and collect once
+        return (
+            date_range.join(combined, on="Date", how="left")
+            .sort("Date")
+            .with_columns(fill)
+            .collect()
+        )
+
+    def _parquet_compression(
+        self, compression: str, pyarrow_dataset: bool = False
+    ) -> dict:
+        """Return the codec and level options shared by both Parquet writers.
 
-        # Sort by date
-        return result.sort("Date")
+        Polars spells the absent codec "uncompressed", pyarrow datasets "none".
+        """
+        codec = compression.lower()
+        if codec not in self.PARQUET_COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+
+        level = self.ZSTD_COMPRESSION_LEVEL if codec == "zstd" else None
+        if pyarrow_dataset and codec == "uncompressed":
+            codec = "none"
+        return {"compression": codec, "compression_level": level}
 
     def save_data(
-        self, data: pl.DataFrame, output_path: Path, format_type: str = "parquet"
+        self,
+        data: pl.DataFrame,
+        output_path: Path,
+        format_type: str = "parquet",
+        parquet_engine: str = "pyarrow",
+        compression: str = "zstd",
+        row_group_size: int = 8192,
+        partitioned: bool = False,
     ):
-        """Save data in specified format."""
+        """Save data in specified format.
+
+        With ``partitioned`` set, Parquet output is written as a dataset
+        directory partitioned by year, see ``save_partitioned``.
+        """
+        if partitioned:
+            if format_type.lower() != "parquet":
+                raise ValueError("Partitioned output requires parquet format")
+            self.save_partitioned(data, output_path, compression, row_group_size)
+            return
+
+        if parquet_engine.lower() not in ["polars", "pyarrow"]:
+            raise ValueError(f"Unsupported parquet engine: {parquet_engine}")
+
+        use_pyarrow = parquet_engine.lower() == "pyarrow"
+        if (
+            format_type.lower() == "parquet"
+            and use_pyarrow
+            and find_spec("pyarrow") is None
+        ):
+            self.console.print(
+                "[yellow]Warning: pyarrow not installed, "
+                "using polars parquet writer[/yellow]"
+            )
+            use_pyarrow = False
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -129,7 +396,13 @@ class FearAndGreedIndex:
             task = progress.add_task(f"Saving data as {format_type}...", total=1)
 
             if format_type.lower() == "parquet":
-                data.write_parquet(output_path)
+                data.write_parquet(
+                    output_path,
+                    **self._parquet_compression(compression),
+                    statistics=True,
+                    row_group_size=row_group_size,
+                    use_pyarrow=use_pyarrow,
+                )
             elif format_type.lower() == "csv":
                 data.write_csv(output_path)
             else:
@@ -139,15 +412,96 @@ class FearAndGreedIndex:
 
         self.console.print(f"[green]✓ Data saved to {output_path}[/green]")
 
+    def save_partitioned(
+        self,
+        data: pl.DataFrame,
+        output_dir: Path,
+        compression: str = "zstd",
+        row_group_size: int = 8192,
+    ):
+        """Save data as a Parquet dataset partitioned by year.
+
+        Only year partitions where ``data`` differs from the stored rows are
+        rewritten; rows already stored in those partitions are merged in, with
+        ``data`` taking precedence. Other partitions are left untouched.
+        """
+        if find_spec("pyarrow") is None:
+            raise ImportError("pyarrow is required for partitioned output")
+
+        # Deferred so that runs without --partitioned do not import pyarrow
+        import pyarrow.dataset as pads
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=self.console,
+        ) as progress:
+            task = progress.add_task("Saving partitioned parquet dataset...", total=1)
+
+            data = data.with_columns(pl.col("Date").dt.year().alias("year"))
+            if any(output_dir.glob("year=*/*.parquet")):
+                existing = (
+                    pl.scan_parquet(output_dir, hive_partitioning=True)
+                    .filter(pl.col("year").is_in(data["year"].unique().to_list()))
+                    .select("Date", "Fear Greed", pl.col("year").cast(pl.Int32))
+                    .collect()
+                )
+                changed_years = (
+                    data.join(
+                        existing.select("Date", pl.col("Fear Greed").alias("stored")),
+                        on="Date",
+                        how="left",
+                    )
+                    .filter(pl.col("Fear Greed").ne_missing(pl.col("stored")))
+                    .get_column("year")
+                    .unique()
+                    .to_list()
+                )
+                data = (
+                    pl.concat([existing, data])
+                    .unique(subset="Date", keep="last")
+                    .filter(pl.col("year").is_in(changed_years))
+                )
+
+            if data.height == 0:
+                progress.advance(task)
+                self.console.print(
+                    f"[green]✓ {output_dir} is already up to date[/green]"
+                )
+                return
+
+            file_format = pads.ParquetFileFormat()
+            pads.write_dataset(
+                data.sort("Date").to_arrow(),
+                output_dir,
+                format=file_format,
+                file_options=file_format.make_write_options(
+                    **self._parquet_compression(compression, pyarrow_dataset=True)
+                ),
+                partitioning=["year"],
+                partitioning_flavor="hive",
+                basename_template="part-{i}.parquet",
+                max_rows_per_group=row_group_size,
+                existing_data_behavior="delete_matching",
+            )
+
+            progress.advance(task)
+
+        self.console.print(f"[green]✓ Data saved to {output_dir}[/green]")
+
     def display_summary(self, data: pl.DataFrame):
         """Display a summary of the processed data."""
-        # Calculate statistics
+        # Calculate statistics in a single aggregation pass
         total_records = data.height
-        date_range = f"{data['Date'].min()} to {data['Date'].max()}"
-        avg_fng = data["Fear Greed"].mean()
-        min_fng = data["Fear Greed"].min()
-        max_fng = data["Fear Greed"].max()
-        missing_count = data.filter(pl.col("Fear Greed") == 0).height
+        min_date, max_date, avg_fng, min_fng, max_fng, missing_count = data.select(
+            pl.col("Date").min(),
+            pl.col("Date").max().alias("max_date"),
+            pl.col("Fear Greed").mean(),
+            pl.col("Fear Greed").min().alias("min_fng"),
+            pl.col("Fear Greed").max().alias("max_fng"),
+            (pl.col("Fear Greed") == 0).sum().alias("missing_count"),
+        ).row(0)
+        date_range = f"{min_date} to {max_date}"
 
         # Create summary table
         table = Table(title="Fear and Greed Index Summary")
@@ -0,0 +1,240 @@
+"""Tests for the FearAndGreedIndex scraper."""
+
+import json
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+import polars as pl
+import pytest
+
+from fng import FearAndGreedIndex
+
+
+def api_payload(values: dict[date, int]) -> dict:
+    """Build a CNN API payload with one record per date."""
+    return {
+        "fear_and_greed_historical": {
+            "data": [
+                {
+                    "x": datetime(d.year, d.month, d.day, tzinfo=timezone.utc)
+                    .timestamp()
+                    * 1000,
+                    "y": float(y),
+                }
+                for d, y in values.items()
+            ]
+        }
+    }
+
+
+def write_existing(path, values: dict[date, Optional[int]]):
+    """Write existing Fear and Greed data to a Parquet file."""
+    pl.DataFrame(
+        {"Date": list(values), "Fear Greed": list(values.values())},
+        schema={"Date": pl.Date, "Fear Greed": pl.Int64},
+    ).write_parquet(path)
+
+
+@pytest.fixture
+def scraper() -> FearAndGreedIndex:
+    return FearAndGreedIndex(use_cache=False)
+
+
+def stub_fetch(scraper, monkeypatch, values: dict[date, int]) -> list[date]:
+    """Replace the API fetch with a stub, returning the list of requested dates."""
+    calls = []
+
+    def fetch(start_date):
+        calls.append(start_date)
+        return api_payload({d: y for d, y in values.items() if d >= start_date})
+
+    monkeypatch.setattr(scraper, "fetch_historical_data", fetch)
+    return calls
+
+
+@pytest.mark.parametrize("placeholder", [0, None])
+def test_placeholder_tail_is_refetched(scraper, monkeypatch, tmp_path, placeholder):
+    existing = tmp_path / "existing.parquet"
+    pl.DataFrame(
+        {
+            "Date": [date(2024, 1, d) for d in range(1, 5)],
+            "Fear Greed": [40, 41, 42, placeholder],
+        },
+        schema={"Date": pl.Date, "Fear Greed": pl.Int64},
+    ).write_parquet(existing)
+
+    calls = stub_fetch(
+        scraper,
+        monkeypatch,
+        {date(2024, 1, 3): 45, date(2024, 1, 4): 50},
+    )
+    data = scraper.process_data(date(2024, 1, 1), date(2024, 1, 4), existing)
+
+    assert calls == [date(2024, 1, 4)]
+    assert data["Fear Greed"].to_list() == [40, 41, 42, 50]
+
+
+def test_existing_ending_at_end_date_skips_api(scraper, monkeypatch, tmp_path):
+    existing = tmp_path / "existing.parquet"
+    write_existing(existing, {date(2024, 1, d): 40 + d for d in range(1, 5)})
+
+    calls = stub_fetch(scraper, monkeypatch, {date(2024, 1, 4): 99})
+    data = scraper.process_data(date(2024, 1, 1), date(2024, 1, 4), existing)
+
+    assert calls == []
+    assert data["Fear Greed"].to_list() == [41, 42, 43, 44]
+
+
+@pytest.mark.parametrize("end_day", [29, 30, 31])
+def test_existing_ending_on_past_weekend_skips_api(
+    scraper, monkeypatch, tmp_path, end_day
+):
+    # 2023-12-30 and 2023-12-31 are a Saturday and Sunday stored as placeholders
+    existing = tmp_path / "existing.parquet"
+    write_existing(
+        existing,
+        {
+            date(2023, 12, 26): 70,
+            date(2023, 12, 27): 71,
+            date(2023, 12, 28): 72,
+            date(2023, 12, 29): 73,
+            date(2023, 12, 30): 0,
+            date(2023, 12, 31): 0,
+        },
+    )
+
+    calls = stub_fetch(scraper, monkeypatch, {date(2023, 12, 29): 99})
+    scraper.process_data(date(2023, 12, 26), date(2023, 12, end_day), existing)
+
+    assert calls == []
+
+
+def test_recent_last_day_is_refetched(scraper, monkeypatch, tmp_path):
+    today = date.today()
+    yesterday = today - timedelta(days=1)
+    existing = tmp_path / "existing.parquet"
+    write_existing(existing, {yesterday: 40, today: 41})
+
+    calls = stub_fetch(scraper, monkeypatch, {today: 55})
+    data = scraper.process_data(yesterday, today, existing)
+
+    assert calls == [today]
+    assert data["Fear Greed"].to_list() == [40, 55]
+
+
+def test_covered_range_skips_api(scraper, monkeypatch, tmp_path):
+    existing = tmp_path / "existing.parquet"
+    pl.DataFrame(
+        {
+            "Date": [date(2024, 1, d) for d in range(1, 6)],
+            "Fear Greed": [40, 41, 42, 43, 44],
+        }
+    ).write_parquet(existing)
+
+    calls = stub_fetch(scraper, monkeypatch, {date(2024, 1, 5): 99})
+    data = scraper.process_data(date(2024, 1, 1), date(2024, 1, 3), existing)
+
+    assert calls == []
+    assert data["Fear Greed"].to_list() == [40, 41, 42]
+
+
+class StubResponse:
+    def __init__(self, status_code: int, content: bytes = b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class StubSession:
+    """Serve the payload with an ETag, then 304 once the ETag is sent back."""
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.requests = []
+
+    def get(self, url, headers, timeout):
+        self.requests.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return StubResponse(304)
+        return StubResponse(200, self.content, {"ETag": '"v1"'})
+
+
+def test_not_modified_reuses_cached_payload(scraper, monkeypatch, tmp_path):
+    monkeypatch.setattr("fng.fngindex.requests_cache", None)
+    monkeypatch.setattr("fng.fngindex.get_cache_dir", lambda: tmp_path)
+    payload = api_payload({date(2024, 1, 2): 42})
+    session = StubSession(json.dumps(payload).encode())
+    scraper.use_cache = True
+    scraper.session = session
+
+    first = scraper.fetch_historical_data(date(2024, 1, 2))
+    second = scraper.fetch_historical_data(date(2024, 1, 2))
+
+    assert first == second == payload
+    assert "If-None-Match" not in session.requests[0]
+    assert session.requests[1]["If-None-Match"] == '"v1"'
+    assert json.loads((tmp_path / "graphdata.meta.json").read_bytes()).keys() == {
+        "start_date",
+        "etag",
+        "last_modified",
+        "payload_file",
+    }
+
+
+def read_dataset(path) -> pl.DataFrame:
+    return (
+        pl.scan_parquet(path, hive_partitioning=True)
+        .select("Date", "Fear Greed")
+        .sort("Date")
+        .collect()
+    )
+
+
+def test_partitioned_rewrite_merges_changed_years(scraper, tmp_path):
+    pytest.importorskip("pyarrow")
+    output_dir = tmp_path / "dataset"
+    output_dir.mkdir()  # An existing empty directory must not break the merge
+
+    scraper.save_partitioned(
+        pl.DataFrame(
+            {
+                "Date": [date(2022, 12, 30), date(2023, 12, 29), date(2024, 1, 2)],
+                "Fear Greed": [30, 40, 50],
+            }
+        ),
+        output_dir,
+    )
+    stored_2022 = output_dir / "year=2022" / "part-0.parquet"
+    mtime_2022 = stored_2022.stat().st_mtime_ns
+
+    scraper.save_partitioned(
+        pl.DataFrame(
+            {
+                "Date": [date(2022, 12, 30), date(2024, 1, 2), date(2024, 1, 3)],
+                "Fear Greed": [30, 55, 60],
+            }
+        ),
+        output_dir,
+    )
+
+    assert read_dataset(output_dir).rows() == [
+        (date(2022, 12, 30), 30),
+        (date(2023, 12, 29), 40),
+        (date(2024, 1, 2), 55),
+        (date(2024, 1, 3), 60),
+    ]
+    assert stored_2022.stat().st_mtime_ns == mtime_2022
+
+
+@pytest.mark.parametrize("partitioned", [False, True])
+def test_uncompressed_parquet_for_both_writers(scraper, tmp_path, partitioned):
+    pytest.importorskip("pyarrow")
+    data = pl.DataFrame({"Date": [date(2024, 1, 2)], "Fear Greed": [50]})
+    output = tmp_path / ("dataset" if partitioned else "data.parquet")
+
+    scraper.save_data(data, output, compression="uncompressed", partitioned=partitioned)
+
+    assert read_dataset(output).rows() == [(date(2024, 1, 2), 50)]